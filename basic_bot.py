@@ -3,9 +3,13 @@
 import time
 import hmac
 import hashlib
-import requests
+import httpx
+import orjson
 import logging
 import argparse
+import functools
+import threading
+from decimal import Decimal, ROUND_DOWN, ROUND_HALF_UP
 from urllib.parse import urlencode
 
 # -----------------------
@@ -28,6 +32,21 @@ fh.setFormatter(fmt)
 logger.addHandler(fh)
 
 
+DEFAULT_BASE_URL = "https://testnet.binancefuture.com"
+
+# API error code for a timestamp outside recvWindow
+TIMESTAMP_OUTSIDE_RECV_WINDOW = -1021
+
+# max distinct order querystrings kept by BasicBot.place_order
+ORDER_TEMPLATE_CACHE_SIZE = 256
+
+# boolean params as the API spells them
+_BOOL = {True: "true", False: "false"}
+
+# (min_qty, step_size, min_price, tick_size) used when exchangeInfo is unavailable
+DEFAULT_FILTERS = (Decimal("0.001"), Decimal("0.001"), Decimal("0.01"), Decimal("0.01"))
+
+
 # -----------------------
 # BasicBot class
 # -----------------------
@@ -36,61 +55,192 @@ class BasicBot:
     Minimal Binance Futures (USDT-M) REST client for placing orders on testnet.
     """
 
+    __slots__ = ("api_key", "api_secret", "base_url", "recv_window", "session", "timeout",
+                 "_hmac_template", "_filters_cache", "_filters_ttl", "_filters_lock",
+                 "_order_template_cache", "_time_offset")
+
     def __init__(self, api_key: str, api_secret: str,
-                 base_url: str = "https://testnet.binancefuture.com",
-                 recv_window: int = 5000, timeout: int = 10):
+                 base_url: str = DEFAULT_BASE_URL,
+                 recv_window: int = 5000, timeout: int = 10, prefetch: bool = True):
         self.api_key = api_key
         self.api_secret = api_secret.encode("utf-8")
         self.base_url = base_url.rstrip("/")
         self.recv_window = recv_window
-        self.session = requests.Session()
-        self.session.headers.update({"X-MBX-APIKEY": api_key})
+        # HTTP/2 multiplexes the dashboard's concurrent GETs and order POSTs over one connection
+        self.session = httpx.Client(
+            http2=True,
+            headers={"X-MBX-APIKEY": api_key},
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=8),
+        )
+        # keyed HMAC state, copied per request instead of re-deriving the key pads
+        # (measurably faster than the one-shot hmac.digest(), which re-keys every call)
+        self._hmac_template = hmac.new(self.api_secret, b"", hashlib.sha256)
         self.timeout = timeout
-        logger.debug(f"Initialized BasicBot with base_url={self.base_url}")
+        self._filters_cache: dict[str, tuple[float, tuple]] = {}
+        self._filters_ttl = 3600
+        self._filters_lock = threading.Lock()
+        self._order_template_cache: dict[tuple, str] = {}
+        self._time_offset = 0  # server time minus local time, in ms
+        logger.debug("Initialized BasicBot with base_url=%s", self.base_url)
+        if prefetch:
+            self.warmup()
 
     # ----- helper: sign querystring -----
-    def _sign(self, data: dict) -> str:
-        """Return signature for a dict of params."""
-        query = urlencode(data, doseq=True)
-        signature = hmac.new(self.api_secret, query.encode("utf-8"), hashlib.sha256).hexdigest()
-        logger.debug(f"Signing query: {query} -> signature: {signature}")
-        return signature
+    def _sign(self, query: str) -> str:
+        """Return signature for an urlencoded querystring."""
+        h = self._hmac_template.copy()
+        h.update(query.encode("utf-8"))
+        return h.hexdigest()
+
+    # ----- helper: request timestamp -----
+    def _timestamp(self) -> int:
+        """Milliseconds timestamp, corrected by the last offset measured in _sync_time() (0 until then)."""
+        return time.time_ns() // 1_000_000 + self._time_offset
+
+    def _sync_time(self):
+        """Measure the local clock's offset against the server so timestamps stay inside recvWindow."""
+        before = time.time_ns()
+        server_time = self._public_request("GET", "/fapi/v1/time")["serverTime"]
+        local_time = (before + time.time_ns()) // 2_000_000  # midpoint of the round-trip, in ms
+        self._time_offset = server_time - local_time
+        logger.debug("Server time offset is %d ms", self._time_offset)
+
+    def _try_sync_time(self) -> bool:
+        """_sync_time() that logs instead of raising; returns whether the offset was updated."""
+        try:
+            self._sync_time()
+            return True
+        except Exception as e:
+            logger.warning("Could not sync server time, keeping the current offset: %s", e)
+            return False
 
-    # ----- helper: do signed request -----
-    def _signed_request(self, method: str, path: str, payload: dict = None):
-        """Make signed request to futures API."""
+    # ----- helper: encode params -----
+    def _encode(self, payload: dict = None) -> str:
+        """Urlencode params with recvWindow; timestamp and signature are added per request."""
         payload = payload.copy() if payload else {}
         payload.setdefault("recvWindow", self.recv_window)
-        payload["timestamp"] = int(time.time() * 1000)
-        signature = self._sign(payload)
-        payload["signature"] = signature
-        url = f"{self.base_url}{path}"
-        logger.info(f"REQUEST -> {method} {url} params={payload}")
-        try:
-            if method.upper() == "GET":
-                r = self.session.get(url, params=payload, timeout=self.timeout)
-            elif method.upper() == "POST":
-                r = self.session.post(url, params=payload, timeout=self.timeout)
-            elif method.upper() == "DELETE":
-                r = self.session.delete(url, params=payload, timeout=self.timeout)
-            else:
-                raise ValueError("Unsupported HTTP method")
-        except requests.RequestException:
-            logger.exception("Network error during API request")
-            raise
-
-        try:
-            content = r.json()
-        except ValueError:
-            content = r.text
-        logger.info(f"RESPONSE <- status={r.status_code} body={content}")
+        return urlencode(payload, doseq=True)
 
-        if not r.ok:
+    # ----- helper: do signed request -----
+    def _signed_request(self, method: str, path: str, payload=None):
+        """Make signed request to futures API.
+
+        payload is a dict of params, or a querystring already built by _encode().
+        A request rejected for its timestamp (-1021) is retried once after resyncing the server time.
+        """
+        method = method.upper()
+        if method not in ("GET", "POST", "DELETE"):
+            raise ValueError("Unsupported HTTP method")
+        # encode once: the same string is signed and sent
+        prefix = payload if isinstance(payload, str) else self._encode(payload)
+        url = f"{self.base_url}{path}"
+        for can_retry in (True, False):
+            query = f"{prefix}&timestamp={self._timestamp()}"
+            logger.info("REQUEST -> %s %s params=%s", method, url, query)
+            try:
+                r = self.session.request(method, f"{url}?{query}&signature={self._sign(query)}")
+            except httpx.HTTPError:
+                logger.exception("Network error during API request")
+                raise
+
+            try:
+                content = orjson.loads(r.content) if r.content else r.text
+            except orjson.JSONDecodeError:
+                content = r.text
+            logger.info("RESPONSE <- status=%d", r.status_code)
+            logger.debug("RESPONSE <- body=%s", content)
+
+            if (can_retry and not r.is_success and isinstance(content, dict)
+                    and content.get("code") == TIMESTAMP_OUTSIDE_RECV_WINDOW and self._try_sync_time()):
+                logger.warning("Timestamp outside recvWindow, retrying with the resynced server time")
+                continue
+            break
+
+        if not r.is_success:
             err_msg = content.get("msg") if isinstance(content, dict) else str(content)
             raise RuntimeError(f"API returned error {r.status_code}: {err_msg}")
 
         return content
 
+    # ----- helper: do public request -----
+    def _public_request(self, method: str, path: str, params: dict = None):
+        """Make unsigned request to a public futures endpoint."""
+        url = f"{self.base_url}{path}"
+        logger.info("REQUEST -> %s %s params=%s", method, url, params)
+        r = self.session.request(method.upper(), url, params=params)
+        logger.info("RESPONSE <- status=%d", r.status_code)
+        r.raise_for_status()
+        return orjson.loads(r.content)
+
+    # ----- helper: cached symbol filters -----
+    def _load_symbol_filters(self):
+        """Fetch exchangeInfo and cache the filters of every symbol."""
+        info = self._public_request("GET", "/fapi/v1/exchangeInfo")
+        now = time.time()
+        cache = {}
+        for s in info["symbols"]:
+            filters = {f["filterType"]: f for f in s["filters"]}
+            cache[s["symbol"]] = (now, (
+                Decimal(filters["LOT_SIZE"]["minQty"]),
+                Decimal(filters["LOT_SIZE"]["stepSize"]),
+                Decimal(filters["PRICE_FILTER"]["minPrice"]),
+                Decimal(filters["PRICE_FILTER"]["tickSize"]),
+            ))
+        self._filters_cache = cache
+        logger.debug("Cached exchange filters for %d symbols", len(self._filters_cache))
+
+    def _filters_fresh(self, symbol: str = None) -> bool:
+        """True if the symbol's cached filters (or, without a symbol, any cached filters) are within _filters_ttl."""
+        if symbol is None:
+            # every entry shares the timestamp of the load that produced it
+            entry = next(iter(self._filters_cache.values()), None)
+        else:
+            entry = self._filters_cache.get(symbol)
+        return entry is not None and time.time() - entry[0] < self._filters_ttl
+
+    def _get_symbol_filters(self, symbol: str) -> tuple:
+        """Return (min_qty, step_size, min_price, tick_size) for a symbol, cached for _filters_ttl seconds."""
+        if not self._filters_fresh(symbol):
+            with self._filters_lock:
+                # a concurrent load (e.g. the warm-up thread) may have refreshed it meanwhile
+                if not self._filters_fresh(symbol):
+                    self._load_symbol_filters()
+
+        cached = self._filters_cache.get(symbol)
+        if cached is None:
+            raise ValueError(f"Symbol {symbol} not found in exchangeInfo")
+        return cached[1]
+
+    # ----- warm-up -----
+    def warmup(self) -> threading.Thread:
+        """Open the connection, sync the clock and fill the filter cache in the background."""
+        t = threading.Thread(target=self._warmup, name="BasicBot-warmup", daemon=True)
+        t.start()
+        return t
+
+    def _warmup(self):
+        # the clock sync runs alongside the filter load, which an early order may be waiting on
+        threading.Thread(target=self._try_sync_time, name="BasicBot-timesync", daemon=True).start()
+        try:
+            with self._filters_lock:
+                # an order may already have loaded them while we waited for the lock
+                if not self._filters_fresh():
+                    self._load_symbol_filters()
+        except Exception as e:
+            logger.warning("Warm-up failed: %s", e)
+
+    # ----- helper: exchange-valid numbers -----
+    @staticmethod
+    def _quantize(value, quantum: Decimal, rounding: str = ROUND_HALF_UP) -> Decimal:
+        """Snap value to a multiple of quantum without float error."""
+        return (Decimal(str(value)) / quantum).to_integral_value(rounding) * quantum
+
+    @staticmethod
+    def _format(value: Decimal) -> str:
+        """Plain decimal string without exponent or trailing zeros, as Binance expects."""
+        return format(value.normalize(), "f")
+
     # ----- place order -----
     def place_order(self, symbol: str, side: str, order_type: str,
                     quantity: float = None, price: float = None,
@@ -106,64 +256,52 @@ class BasicBot:
         if order_type not in ("MARKET", "LIMIT", "STOP_LIMIT"):
             raise ValueError("order_type must be MARKET, LIMIT or STOP_LIMIT")
 
-        # ---- Fetch exchange info ----
+        # ---- Fetch exchange filters ----
         try:
-            info = self._signed_request("GET", "/fapi/v1/exchangeInfo", payload={})
-            for s in info['symbols']:
-                if s['symbol'] == symbol:
-                    filters = {f['filterType']: f for f in s['filters']}
-                    min_qty = float(filters['LOT_SIZE']['minQty'])
-                    step_size = float(filters['LOT_SIZE']['stepSize'])
-                    min_price = float(filters['PRICE_FILTER']['minPrice'])
-                    tick_size = float(filters['PRICE_FILTER']['tickSize'])
-                    break
-            else:
-                raise ValueError(f"Symbol {symbol} not found in exchangeInfo")
+            min_qty, step_size, min_price, tick_size = self._get_symbol_filters(symbol)
         except Exception as e:
-            logger.warning(f"Could not fetch exchange info: {e}")
-            min_qty, step_size, min_price, tick_size = 0.001, 0.001, 0.01, 0.01
-
-        # ---- Round to valid steps ----
-        def round_step(value, step):
-            return round(value / step) * step
+            logger.warning("Could not fetch exchange info: %s", e)
+            min_qty, step_size, min_price, tick_size = DEFAULT_FILTERS
 
+        # ---- Round to valid steps (never more than the requested size, nearest tick for prices) ----
         if quantity:
-            quantity = max(min_qty, round_step(quantity, step_size))
+            quantity = self._format(max(min_qty, self._quantize(quantity, step_size, ROUND_DOWN)))
         if price:
-            price = max(min_price, round_step(price, tick_size))
-        logger.info(f"Adjusted quantity={quantity}, price={price}")
-
-        # ---- Build params ----
-        params = {
-            "symbol": symbol,
-            "side": side,
-            "quantity": quantity,
-            "reduceOnly": str(reduce_only).lower(),
-            "closePosition": str(close_position).lower(),
-        }
-
-        if position_side:
-            params["positionSide"] = position_side
-
-        if order_type == "MARKET":
-            params["type"] = "MARKET"
-        elif order_type == "LIMIT":
-            params.update({
-                "type": "LIMIT",
-                "price": price,
-                "timeInForce": time_in_force
-            })
-        elif order_type == "STOP_LIMIT":
-            params.update({
-                "type": "STOP",
-                "price": price,
-                "stopPrice": stop_price,
-                "timeInForce": time_in_force
-            })
-
-        params = {k: v for k, v in params.items() if v is not None}
-
-        return self._signed_request("POST", "/fapi/v1/order", payload=params)
+            price = self._format(max(min_price, self._quantize(price, tick_size)))
+        if stop_price:
+            stop_price = self._format(max(min_price, self._quantize(stop_price, tick_size)))
+        logger.info("Adjusted quantity=%s, price=%s, stop_price=%s", quantity, price, stop_price)
+
+        # ---- Build params (encoded once per distinct order) ----
+        key = (symbol, side, order_type, quantity, price, stop_price, time_in_force,
+               reduce_only, close_position, position_side)
+        query = self._order_template_cache.get(key)
+        if query is None:
+            params = {
+                "symbol": symbol,
+                "side": side,
+                "type": "STOP" if order_type == "STOP_LIMIT" else order_type,
+                "reduceOnly": _BOOL[bool(reduce_only)],
+                "closePosition": _BOOL[bool(close_position)],
+            }
+            if quantity is not None:
+                params["quantity"] = quantity
+            if position_side:
+                params["positionSide"] = position_side
+            if order_type != "MARKET":
+                if price is not None:
+                    params["price"] = price
+                if order_type == "STOP_LIMIT" and stop_price is not None:
+                    params["stopPrice"] = stop_price
+                if time_in_force is not None:
+                    params["timeInForce"] = time_in_force
+
+            query = self._encode(params)
+            if len(self._order_template_cache) >= ORDER_TEMPLATE_CACHE_SIZE:
+                self._order_template_cache.clear()
+            self._order_template_cache[key] = query
+
+        return self._signed_request("POST", "/fapi/v1/order", payload=query)
 
     # ----- get order status -----
     def get_order(self, symbol: str, order_id: int = None, orig_client_order_id: str = None):
@@ -193,14 +331,16 @@ class BasicBot:
 # -----------------------
 # CLI handling
 # -----------------------
-def parse_args():
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser once, on first use (importers of BasicBot never pay for it)."""
     p = argparse.ArgumentParser(description="Basic Binance Futures Testnet Trading Bot CLI")
     sub = p.add_subparsers(dest="cmd", required=True)
 
     order_p = sub.add_parser("order", help="Place an order")
     order_p.add_argument("--api-key", required=True)
     order_p.add_argument("--api-secret", required=True)
-    order_p.add_argument("--base-url", default="https://testnet.binancefuture.com")
+    order_p.add_argument("--base-url", default=DEFAULT_BASE_URL)
     order_p.add_argument("--symbol", required=True)
     order_p.add_argument("--side", required=True, choices=["BUY", "SELL"])
     order_p.add_argument("--type", required=True, choices=["MARKET", "LIMIT", "STOP_LIMIT"])
@@ -215,7 +355,7 @@ def parse_args():
     q_p = sub.add_parser("query", help="Query order status")
     q_p.add_argument("--api-key", required=True)
     q_p.add_argument("--api-secret", required=True)
-    q_p.add_argument("--base-url", default="https://testnet.binancefuture.com")
+    q_p.add_argument("--base-url", default=DEFAULT_BASE_URL)
     q_p.add_argument("--symbol", required=True)
     q_p.add_argument("--order-id", type=int)
     q_p.add_argument("--orig-client-order-id", type=str)
@@ -223,18 +363,23 @@ def parse_args():
     c_p = sub.add_parser("cancel", help="Cancel order")
     c_p.add_argument("--api-key", required=True)
     c_p.add_argument("--api-secret", required=True)
-    c_p.add_argument("--base-url", default="https://testnet.binancefuture.com")
+    c_p.add_argument("--base-url", default=DEFAULT_BASE_URL)
     c_p.add_argument("--symbol", required=True)
     c_p.add_argument("--order-id", type=int)
     c_p.add_argument("--orig-client-order-id", type=str)
 
-    return p.parse_args()
+    return p
+
+
+def parse_args():
+    return _build_parser().parse_args()
 
 
 def main():
     args = parse_args()
 
-    bot = BasicBot(args.api_key, args.api_secret, base_url=args.base_url)
+    # only orders need the exchange filters
+    bot = BasicBot(args.api_key, args.api_secret, base_url=args.base_url, prefetch=args.cmd == "order")
 
     try:
         if args.cmd == "order":
@@ -1,7 +1,9 @@
 import streamlit as st
-from basic_bot import BasicBot
+from streamlit_autorefresh import st_autorefresh
+from basic_bot import BasicBot, DEFAULT_BASE_URL
 import pandas as pd
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 
 # Streamlit Config
@@ -25,43 +27,100 @@ except Exception:
     st.error("❌ Missing API credentials in .streamlit/secrets.toml")
     st.stop()
 
-bot = BasicBot(API_KEY, API_SECRET, base_url="https://testnet.binancefuture.com")
+
+@st.cache_resource
+def get_bot(api_key, api_secret, base_url):
+    # one bot (and its HTTP session / connection pool) for the lifetime of the app
+    return BasicBot(api_key, api_secret, base_url=base_url)
+
+bot = get_bot(API_KEY, API_SECRET, DEFAULT_BASE_URL)
 
 
 # Helper functions
 
+ORDER_HISTORY_LIMIT = 10
+MAX_REFRESH_RATE = 60  # seconds; also bounds how long any cached response can be served
+
+
+@st.cache_resource
+def get_executor():
+    return ThreadPoolExecutor(max_workers=3)
+
+
+# each call is cached on only what it depends on: a symbol change refetches just the order history
+@st.cache_data(max_entries=1, ttl=MAX_REFRESH_RATE, show_spinner=False)
+def fetch_balance(epoch):
+    return bot._signed_request("GET", "/fapi/v2/balance")
+
+
+@st.cache_data(max_entries=1, ttl=MAX_REFRESH_RATE, show_spinner=False)
+def fetch_positions(epoch):
+    return bot._signed_request("GET", "/fapi/v2/positionRisk")
+
 
-def get_balance():
+# one entry per symbol in the current epoch, so viewers on different symbols don't evict each other
+@st.cache_data(max_entries=32, ttl=MAX_REFRESH_RATE, show_spinner=False)
+def fetch_order_history(symbol, limit, epoch):
+    return bot._signed_request("GET", "/fapi/v1/allOrders", payload={"symbol": symbol, "limit": limit})
+
+
+def fetch_all(symbol, limit, epoch):
+    """Run the cached fetches concurrently; failures are returned in place of the JSON."""
+    executor = get_executor()
+    futures = {
+        executor.submit(fetch_balance, epoch): "balance",
+        executor.submit(fetch_positions, epoch): "positions",
+        executor.submit(fetch_order_history, symbol, limit, epoch): "orders",
+    }
+    results = {}
+    for future in as_completed(futures):
+        try:
+            results[futures[future]] = future.result()
+        except Exception as e:
+            results[futures[future]] = e
+    return results
+
+
+def clear_fetch_cache():
+    for fetch in (fetch_balance, fetch_positions, fetch_order_history):
+        fetch.clear()
+
+
+def get_balance(balances):
     try:
-        balances = bot._signed_request("GET", "/fapi/v2/balance")
-        df = pd.DataFrame(balances)
-        df = df[["asset", "balance", "availableBalance"]]
-        df["balance"] = df["balance"].astype(float).round(2)
-        df["availableBalance"] = df["availableBalance"].astype(float).round(2)
-        return df
+        if isinstance(balances, Exception):
+            raise balances
+        num = {"balance": 2, "availableBalance": 2}
+        df = pd.DataFrame(balances)[["asset", *num]]
+        df[list(num)] = df[list(num)].apply(pd.to_numeric, errors="coerce")
+        return df.round(num)
     except Exception as e:
         st.error(f"Error fetching balance: {e}")
         return pd.DataFrame()
 
-def get_positions():
+def get_positions(positions):
     try:
-        positions = bot._signed_request("GET", "/fapi/v2/positionRisk")
+        if isinstance(positions, Exception):
+            raise positions
         df = pd.DataFrame(positions)
-        df = df[df["positionAmt"].astype(float) != 0.0]  # show only open positions
         if df.empty:
             return pd.DataFrame()
-        df = df[["symbol", "positionSide", "positionAmt", "entryPrice", "unRealizedProfit", "leverage"]]
-        df["positionAmt"] = df["positionAmt"].astype(float).round(4)
-        df["entryPrice"] = df["entryPrice"].astype(float).round(2)
-        df["unRealizedProfit"] = df["unRealizedProfit"].astype(float).round(2)
-        return df
+        amt = pd.to_numeric(df["positionAmt"], errors="coerce")
+        cols = ["symbol", "positionSide", "positionAmt", "entryPrice", "unRealizedProfit", "leverage"]
+        df = df.loc[amt != 0, cols]  # show only open positions
+        if df.empty:
+            return pd.DataFrame()
+        num = {"positionAmt": 4, "entryPrice": 2, "unRealizedProfit": 2}
+        df[list(num)] = df[list(num)].apply(pd.to_numeric, errors="coerce")
+        return df.round(num)
     except Exception as e:
         st.error(f"Error fetching positions: {e}")
         return pd.DataFrame()
 
-def get_order_history(limit=10):
+def get_order_history(orders):
     try:
-        orders = bot._signed_request("GET", "/fapi/v1/allOrders", payload={"symbol": "BTCUSDT", "limit": limit})
+        if isinstance(orders, Exception):
+            raise orders
         df = pd.DataFrame(orders)
         if df.empty:
             return pd.DataFrame()
@@ -92,6 +151,7 @@ if st.sidebar.button("🚀 Place Order"):
         try:
             resp = bot.place_order(symbol, side, order_type, quantity, price)
             st.sidebar.success("✅ Order placed successfully!")
+            clear_fetch_cache()  # show the new order without waiting for the next refresh
             st.sidebar.json(resp)
         except Exception as e:
             st.sidebar.error(f"❌ {e}")
@@ -101,9 +161,27 @@ if st.sidebar.button("🚀 Place Order"):
 
 col1, col2, col3 = st.columns([1, 2, 2])
 
+
+# Auto-refresh option
+
+st.markdown("---")
+refresh_rate = st.slider("🔄 Auto-refresh (seconds)", 0, MAX_REFRESH_RATE, 10)
+if refresh_rate > 0:
+    st.info(f"Auto-refreshing every {refresh_rate} seconds...")
+    # reruns are scheduled by the browser, so the script thread never sleeps
+    st_autorefresh(interval=refresh_rate * 1000, key="refresh")
+    # wall-clock epoch, not the autorefresh counter: that counter is per browser session and
+    # restarts at 0 on reload, while the cache is shared by every session in the process
+    epoch = int(time.time() // refresh_rate)
+else:
+    epoch = time.time()  # no auto-refresh: fetch on every rerun
+
+# one fetch per refresh epoch (order history also per symbol); other widget reruns reuse it
+data = fetch_all(symbol, ORDER_HISTORY_LIMIT, epoch)
+
 with col1:
     st.subheader("💰 Balance")
-    balance_df = get_balance()
+    balance_df = get_balance(data["balance"])
     if not balance_df.empty:
         st.dataframe(balance_df, use_container_width=True)
     else:
@@ -111,26 +189,16 @@ with col1:
 
 with col2:
     st.subheader("📈 Open Positions")
-    pos_df = get_positions()
+    pos_df = get_positions(data["positions"])
     if not pos_df.empty:
         st.dataframe(pos_df, use_container_width=True)
     else:
         st.info("No open positions")
 
 with col3:
-    st.subheader("🧾 Order History (Last 10)")
-    orders_df = get_order_history()
+    st.subheader(f"🧾 {symbol} Order History (Last {ORDER_HISTORY_LIMIT})")
+    orders_df = get_order_history(data["orders"])
     if not orders_df.empty:
         st.dataframe(orders_df, use_container_width=True)
     else:
         st.info("No recent orders")
-
-
-# Auto-refresh option
-
-st.markdown("---")
-refresh_rate = st.slider("🔄 Auto-refresh (seconds)", 0, 60, 10)
-if refresh_rate > 0:
-    st.info(f"Auto-refreshing every {refresh_rate} seconds...")
-    time.sleep(refresh_rate)
-    st.rerun()
@@ -6,11 +6,11 @@ Simple CLI UI for Binance Futures Testnet Bot
 from rich.console import Console
 from rich.table import Table
 from prompt_toolkit import prompt
-from basic_bot import BasicBot  # import your existing bot
+from basic_bot import BasicBot, DEFAULT_BASE_URL  # import your existing bot
 
 API_KEY = "        "
 API_SECRET = "     "
-BASE_URL = "https://testnet.binancefuture.com"
+BASE_URL = DEFAULT_BASE_URL
 
 console = Console()
 bot = BasicBot(API_KEY, API_SECRET, base_url=BASE_URL)
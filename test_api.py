@@ -1,18 +1,18 @@
-from binance.client import Client
+from basic_bot import BasicBot
 
 # Replace with your new Testnet API keys
 API_KEY = "        "
 API_SECRET = "    "
 
 # Create client (Testnet Futures)
-client = Client(API_KEY, API_SECRET, testnet=True)
+bot = BasicBot(API_KEY, API_SECRET, prefetch=False)
 
 try:
     # Test connectivity
-    print("Server time:", client.futures_ping())
-    
+    print("Server time:", bot._public_request("GET", "/fapi/v1/time"))
+
     # Check account balance
-    balances = client.futures_account_balance()
+    balances = bot._signed_request("GET", "/fapi/v2/balance")
     print("Balances:", balances)
 
     print("✅ API key is working!")